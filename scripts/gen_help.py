@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Render `sittr --help` once and write it to src/sittr/_help.txt, which the
+CLI prints for a bare `sittr` instead of building the help at runtime.
+
+Re-run after changing commands or their docstrings, before building:
+
+    uv run python scripts/gen_help.py
+"""
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC))
+
+from typer.testing import CliRunner  # noqa: E402
+
+from sittr.common import HELP_PATH  # noqa: E402
+from sittr.typer_app import app  # noqa: E402
+
+
+def main():
+    result = CliRunner().invoke(app, ["--help"], prog_name="sittr", env={"COLUMNS": "80"})
+    if result.exit_code != 0:
+        sys.exit(result.output)
+    HELP_PATH.write_text(result.output)
+    print(f"Wrote {HELP_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+"""
+sittr CLI tool for AgentSitter.ai
+"""
+
+
+def __getattr__(name):
+    # keep `sittr.app` available without importing typer for every command
+    if name == "app":
+        from sittr.typer_app import app
+        return app
+    raise AttributeError(f"module 'sittr' has no attribute {name!r}")
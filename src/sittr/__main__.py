@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+sittr entry point: a small argparse dispatcher that imports only the
+module of the command being run. Shell completion requests (which arrive
+as a bare `sittr` with _SITTR_COMPLETE set), anything it doesn't recognise
+(including typer's --install-completion) and `sittr typer-app ...` go to
+the full typer app.
+"""
+import argparse
+import inspect
+import os
+import sys
+import typing
+
+from sittr import term
+from sittr.cmds import COMMANDS, load_command
+from sittr.common import HELP_PATH
+
+
+def build_parser(name: str, fn) -> argparse.ArgumentParser:
+    """Build a parser from a command's signature, the way typer maps it."""
+    parser = argparse.ArgumentParser(
+        prog=f"sittr {name}",
+        description=inspect.cleandoc(fn.__doc__ or ""),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    for param in inspect.signature(fn).parameters.values():
+        flag = "--" + param.name.replace("_", "-")
+        if param.default is inspect.Parameter.empty:
+            nargs = "+" if typing.get_origin(param.annotation) is list else None
+            parser.add_argument(param.name, nargs=nargs)
+        elif isinstance(param.default, bool):
+            parser.add_argument(flag, dest=param.name, default=param.default,
+                                action=argparse.BooleanOptionalAction)
+        else:
+            parser.add_argument(flag, dest=param.name, default=param.default,
+                                type=type(param.default))
+    return parser
+
+
+def run_command(argv: list[str]):
+    """Run the sittr command named by argv[0] with the remaining arguments."""
+    name, *args = argv
+    fn = load_command(name)
+    fn(**vars(build_parser(name, fn).parse_args(args)))
+
+
+def main(argv: list[str] | None = None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    if "_SITTR_COMPLETE" in os.environ:
+        from sittr.typer_app import app
+        app(prog_name="sittr")
+        return
+
+    if (not argv or argv[0] in ("-h", "--help")) and HELP_PATH.exists():
+        term.echo(HELP_PATH.read_text(), nl=False)
+        return
+
+    if argv and argv[0] in COMMANDS:
+        try:
+            run_command(argv)
+        except term.Exit as e:
+            sys.exit(e.exit_code)
+        except (KeyboardInterrupt, EOFError):
+            term.echo()
+            term.secho("Aborted!", fg=term.colors.RED)
+            sys.exit(1)
+        return
+
+    if argv and argv[0] == "typer-app":
+        argv = argv[1:]
+    from sittr.typer_app import app
+    app(args=argv, prog_name="sittr")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+sittr subcommands, grouped by area. Each module only imports the
+standard library, so `sittr <command>` stays cheap to start.
+"""
+import importlib
+
+# command name -> module in sittr.cmds that defines it, in help order.
+# Both the argparse dispatcher and the typer app are built from this.
+COMMANDS = {
+    "init": "core",
+    "cleanup": "core",
+    "token": "core",
+    "cert-install": "cert",
+    "cert-reinstall": "cert",
+    "cert-remove": "cert",
+    "cert-ls": "cert",
+    "docker-network-setup": "network",
+    "docker-network-cleanup": "network",
+    "tunnel-start": "tunnel",
+    "tunnel-stop": "tunnel",
+    "dashboard": "core",
+    "status": "core",
+    "batch": "core",
+}
+
+
+def load_command(name: str):
+    """Import the module defining the named command and return its function."""
+    module = importlib.import_module(f"sittr.cmds.{COMMANDS[name]}")
+    return getattr(module, name.replace("-", "_"))
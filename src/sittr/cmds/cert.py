@@ -0,0 +1,266 @@
+"""
+Certificate commands: fetch the AgentSitter CA and trust it in the
+NSS DB (Linux) or System keychain (macOS).
+"""
+import subprocess
+from pathlib import Path
+
+from sittr import term
+from sittr.common import (
+    CERT_URL,
+    CERT_PATH,
+    CERT_ETAG_PATH,
+    IS_LINUX,
+    IS_DARWIN,
+    invalidate_status_cache,
+    spawn,
+)
+
+
+def cert_installed() -> bool:
+    """Return True if the agent-sitter CA is present."""
+    if IS_LINUX:
+        nssdb = Path.home() / ".pki" / "nssdb"
+        res = subprocess.run(
+            ["certutil", "-L", "-d", f"sql:{nssdb}", "-n", "agent-sitter"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        return res.returncode == 0
+    elif IS_DARWIN:
+        res = subprocess.run(
+            ["security", "find-certificate", "-c", "agent-sitter"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        return res.returncode == 0
+    return False
+
+
+def fetch_cert() -> bool:
+    """
+    Download CERT_URL to CERT_PATH, revalidating an existing copy with
+    If-Modified-Since / If-None-Match. Returns False if it is unchanged.
+    """
+    import shutil
+    from email.utils import formatdate
+    from urllib.error import HTTPError
+    from urllib.request import Request, urlopen
+
+    headers = {}
+    if CERT_PATH.exists():
+        headers["If-Modified-Since"] = formatdate(CERT_PATH.stat().st_mtime, usegmt=True)
+        if CERT_ETAG_PATH.exists():
+            headers["If-None-Match"] = CERT_ETAG_PATH.read_text().strip()
+    try:
+        resp = urlopen(Request(CERT_URL, headers=headers), timeout=15)
+    except HTTPError as e:
+        if e.code == 304:
+            return False
+        raise
+
+    # download next to the cert and swap it in, so a failed fetch can't
+    # leave a truncated file that later looks up to date
+    part = CERT_PATH.with_name(CERT_PATH.name + ".part")
+    with resp, open(part, "wb") as f:
+        shutil.copyfileobj(resp, f)
+    part.replace(CERT_PATH)
+    etag = resp.headers.get("ETag")
+    if etag:
+        CERT_ETAG_PATH.write_text(etag)
+    else:
+        CERT_ETAG_PATH.unlink(missing_ok=True)
+    return True
+
+
+def nss_import_cert(nssdb: Path) -> bool:
+    """
+    Import CERT_PATH into the NSS DB in-process via python-nss.
+    Returns False if python-nss is unavailable or the import fails,
+    so the caller can fall back to certutil.
+    """
+    try:
+        import nss.nss as nss
+    except ImportError:
+        return False
+    try:
+        nss.nss_init_read_write(f"sql:{nssdb}")
+    except Exception:
+        return False
+    try:
+        certdb = nss.get_default_certdb()
+        der = nss.read_der_from_file(str(CERT_PATH), True)
+        cert = nss.Certificate(der, certdb, True, "agent-sitter")
+        cert.set_trust_attributes("C,,", certdb, nss.certUsageSSLCA)
+        # NSS won't shut down while objects still reference the DB
+        del cert, certdb
+        imported = True
+    except Exception:
+        imported = False
+    try:
+        nss.nss_shutdown()
+    except Exception:
+        pass
+    return imported
+
+
+def cert_install():
+    """
+    Fetch and trust the AgentSitter root CA certificate:
+      - Linux: import into NSS DB (~/.pki/nssdb) for Firefox/Chromium
+      - macOS: add to System keychain for Safari/Chrome
+    """
+    invalidate_status_cache()
+    # Always revalidate against the latest CA cert
+    fetched = fetch_cert()
+    installed = cert_installed()
+    if fetched:
+        term.secho(f"Fetched CA certificate to {CERT_PATH}", fg=term.colors.GREEN)
+    elif installed:
+        term.secho(f"CA certificate at {CERT_PATH} is unchanged and already trusted", fg=term.colors.GREEN)
+        return
+    else:
+        term.secho(f"CA certificate at {CERT_PATH} is up to date", fg=term.colors.GREEN)
+
+    if IS_LINUX:
+        nssdb = Path.home() / ".pki" / "nssdb"
+        nssdb.mkdir(parents=True, exist_ok=True)
+        if installed:
+            # replace the stale entry in one certutil session
+            certutil_reinstall(nssdb)
+        elif not nss_import_cert(nssdb):
+            spawn([
+                "certutil", "-A", "-d", f"sql:{nssdb}",
+                "-n", "agent-sitter", "-t", "C,,", "-i", str(CERT_PATH)
+            ], check=True)
+        term.secho("Imported CA into NSS DB for Firefox/Chromium", fg=term.colors.GREEN)
+
+    elif IS_DARWIN:
+        spawn([
+            "sudo", "security", "add-trusted-cert",
+            "-d", "-r", "trustRoot",
+            "-k", "/Library/Keychains/System.keychain",
+            str(CERT_PATH)
+        ], check=True)
+        term.secho("Imported CA into macOS System keychain", fg=term.colors.GREEN)
+
+    else:
+        term.secho("Unsupported OS for automatic cert install", fg=term.colors.RED)
+        raise term.Exit(1)
+
+
+def certutil_reinstall(nssdb: Path):
+    """
+    Delete and re-add the agent-sitter cert using a single
+    `certutil -B` batch session instead of two certutil runs.
+    """
+    import tempfile
+    with tempfile.NamedTemporaryFile("w", suffix=".certutil", delete_on_close=False) as batch_file:
+        batch_file.write(
+            "-D -n agent-sitter\n"
+            f'-A -n agent-sitter -t C,, -i "{CERT_PATH}"\n'
+        )
+        batch_file.close()
+        spawn([
+            "certutil", "-B", "-d", f"sql:{nssdb}", "-i", batch_file.name
+        ], check=True)
+
+
+def cert_reinstall():
+    """
+    Re-fetch the CA certificate and replace the trusted copy:
+      - Linux: delete and re-add in a single certutil session
+      - macOS: remove from and re-add to System keychain
+    """
+    invalidate_status_cache()
+    if not cert_installed():
+        cert_install()
+        return
+
+    if IS_DARWIN:
+        cert_remove()
+        cert_install()
+        return
+
+    if fetch_cert():
+        term.secho(f"Fetched CA certificate to {CERT_PATH}", fg=term.colors.GREEN)
+    nssdb = Path.home() / ".pki" / "nssdb"
+    certutil_reinstall(nssdb)
+    term.secho("Re-imported CA into NSS DB for Firefox/Chromium", fg=term.colors.GREEN)
+
+
+def cert_remove():
+    """
+    Remove the trusted CA certificate:
+      - Linux: delete from NSS DB
+      - macOS: delete from System keychain
+    """
+    invalidate_status_cache()
+    if IS_LINUX:
+        nssdb = Path.home() / ".pki" / "nssdb"
+        subprocess.run([
+            "certutil", "-d", f"sql:{nssdb}", "-D", "-n", "agent-sitter"
+        ], check=False)
+        term.secho("Removed CA from NSS DB", fg=term.colors.GREEN)
+
+    elif IS_DARWIN:
+        subprocess.run([
+            "sudo", "security", "delete-certificate", "-c", "agent-sitter"
+        ], check=False)
+        term.secho("Removed CA from macOS System keychain", fg=term.colors.GREEN)
+
+    else:
+        term.secho("Unsupported OS for automatic cert removal", fg=term.colors.RED)
+        raise term.Exit(1)
+
+
+async def run_listings(cmds: list[list[str]]) -> list[tuple[bytes, bytes]]:
+    """Run the listing commands concurrently and return their (stdout, stderr), in order."""
+    import asyncio
+
+    async def run(cmd):
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        return await proc.communicate()
+
+    return await asyncio.gather(*(run(cmd) for cmd in cmds))
+
+
+def cert_ls():
+    """
+    List the AgentSitter CA certificates currently installed:
+      - Linux: show entries in NSS DB and any Firefox profiles
+      - macOS: show entries in System and login keychains
+    """
+    import asyncio
+    if IS_LINUX:
+        nssdb = Path.home() / ".pki" / "nssdb"
+        listings = [("Certificates in NSS DB (~/.pki/nssdb):", ["certutil", "-L", "-d", f"sql:{nssdb}"])]
+        for db in sorted((Path.home() / ".mozilla" / "firefox").glob("*/cert9.db")):
+            listings.append((
+                f"Certificates in Firefox profile '{db.parent.name}':",
+                ["certutil", "-L", "-d", f"sql:{db.parent}"],
+            ))
+
+    elif IS_DARWIN:
+        keychains = [
+            ("System", "/Library/Keychains/System.keychain"),
+            ("login", str(Path.home() / "Library" / "Keychains" / "login.keychain-db")),
+        ]
+        listings = [
+            (
+                f"Certificates in macOS {name} keychain with label 'agent-sitter':",
+                ["security", "find-certificate", "-c", "agent-sitter", "-a", "-Z", path],
+            )
+            for name, path in keychains
+        ]
+
+    else:
+        term.secho("Unsupported OS for cert listing", fg=term.colors.RED)
+        raise term.Exit(1)
+
+    outputs = asyncio.run(run_listings([cmd for _, cmd in listings]))
+    for (title, _), (out, err) in zip(listings, outputs):
+        term.secho(title, fg=term.colors.BLUE)
+        term.echo(out.decode(errors="replace"), nl=False)
+        if err:
+            term.secho(err.decode(errors="replace"), fg=term.colors.RED, nl=False)
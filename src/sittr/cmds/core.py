@@ -0,0 +1,255 @@
+"""
+Top-level commands: interactive init/cleanup, token, dashboard,
+status and batch.
+"""
+import os
+import json
+
+from sittr import term
+from sittr.common import (
+    DEFAULT_DASHBOARD_URL,
+    DEFAULT_TOKEN_URL,
+    NETWORK_NAME,
+    STATUS_CACHE_PATH,
+    STATUS_CACHE_TTL,
+    RC_PATH,
+)
+from sittr.cmds.cert import cert_install, cert_installed, cert_remove
+from sittr.cmds.network import docker_network_cleanup, docker_network_setup, network_exists
+from sittr.cmds.tunnel import proxy_listening, tunnel_running, tunnel_start, tunnel_stop
+
+
+def init():
+    """
+    Interactive initialization: choose local or docker, then
+    run cert-install, tunnel-start, dashboard & token (local),
+    or docker-network-setup, tunnel-start, dashboard & token (docker).
+    """
+    # 1) Ask which environment
+    env = term.prompt("Initialize for which environment? [local/docker]", default="local")
+    env = env.lower().strip()
+    if env not in ("local", "docker"):
+        term.secho(f"Invalid choice '{env}', defaulting to local.", fg=term.colors.YELLOW)
+        env = "local"
+
+    # 2) Build the list of (description, function) steps
+    if env == "local":
+        steps = [
+            ("Fetch & install CA certificate", cert_install),
+            ("Start the local stunnel", tunnel_start),
+            ("Open the dashboard in your browser", dashboard),
+            ("Open the token URL", token),
+        ]
+    else:
+        steps = [
+            ("Create Docker network & iptables rules", docker_network_setup),
+            ("Start the local stunnel", tunnel_start),
+            ("Open the dashboard in your browser", dashboard),
+            ("Open the token URL", token),
+        ]
+
+    # 3) Iterate, asking y/n for each
+    for description, action in steps:
+        if term.confirm(f"{description}?"):
+            action()  # call the command function directly
+        else:
+            term.secho(f"Skipped: {description}", fg=term.colors.YELLOW)
+
+
+def token_present() -> bool:
+    """Return True if AGENTSITTER_TOKEN is in env or bashrc."""
+    if RC_PATH.exists():
+        for line in RC_PATH.read_text().splitlines():
+            if line.strip().startswith("export AGENTSITTER_TOKEN="):
+                return True
+    return False
+
+
+def remove_token_from_bashrc():
+    """Remove any AGENTSITTER_TOKEN export lines from ~/.bashrc."""
+    if not RC_PATH.exists():
+        return
+    lines = RC_PATH.read_text().splitlines()
+    new = [l for l in lines if not l.strip().startswith("export AGENTSITTER_TOKEN=")]
+    RC_PATH.write_text("\n".join(new) + "\n")
+    term.secho("Removed AGENTSITTER_TOKEN from ~/.bashrc", fg=term.colors.GREEN)
+
+
+def cleanup():
+    """
+    Interactive cleanup: remove cert and/or Docker network, if present.
+    """
+    steps = []
+
+    if tunnel_running():
+        steps.append(("Stop the local stunnel", tunnel_stop))
+    else:
+        term.secho("No stunnel process found; skipping tunnel stop.", fg=term.colors.YELLOW)
+    if cert_installed():
+        steps.append(("Remove the AgentSitter CA certificate", cert_remove))
+    else:
+        term.secho("No AgentSitter CA certificate found; skipping cert removal.", fg=term.colors.YELLOW)
+
+    if network_exists():
+        steps.append(("Tear down Docker network & iptables rules", docker_network_cleanup))
+    else:
+        term.secho(f"No Docker network '{NETWORK_NAME}' found; skipping network cleanup.", fg=term.colors.YELLOW)
+    if token_present():
+        steps.append(("Remove AGENTSITTER_TOKEN from ~/.bashrc", remove_token_from_bashrc))
+    else:
+        term.secho("No AGENTSITTER_TOKEN found; skipping token cleanup.", fg=term.colors.YELLOW)
+
+
+    if not steps:
+        term.secho("Nothing to clean up.", fg=term.colors.GREEN)
+        return
+
+    for description, action in steps:
+        if term.confirm(f"{description}?"):
+            action()
+        else:
+            term.secho(f"Skipped: {description}", fg=term.colors.YELLOW)
+
+
+def token():
+    """
+    Show the URL where you can obtain a new API token.
+    Prompt for your API token, export it to this session and
+    persist it in ~/.bashrc (avoiding duplicates).
+    """
+    import webbrowser
+    webbrowser.open(DEFAULT_TOKEN_URL)
+    term.secho(f"Obtain your API token at: {DEFAULT_TOKEN_URL}", fg=term.colors.BLUE)
+    # prompt
+    token_val = term.prompt("Paste your AgentSitter API token")
+
+    # set in current session
+    os.environ["AGENTSITTER_TOKEN"] = token_val
+    term.secho("AGENTSITTER_TOKEN set in current session", fg=term.colors.GREEN)
+
+    # ensure bashrc exists
+    lines = RC_PATH.read_text().splitlines() if RC_PATH.exists() else []
+    export_line = f'export AGENTSITTER_TOKEN="{token_val}"'
+
+    # remove any old export
+    lines = [l for l in lines if not l.strip().startswith("export AGENTSITTER_TOKEN=")]
+    lines.append(export_line)
+    RC_PATH.write_text("\n".join(lines) + "\n")
+    term.secho(f"Added AGENTSITTER_TOKEN to {RC_PATH}", fg=term.colors.GREEN)
+    # 3) print the export for the parent shell
+    term.echo("to set env var run:")
+    export_cmd = f'export AGENTSITTER_TOKEN="{token_val}"'
+    term.echo(export_cmd)
+
+
+def dashboard():
+    """
+    Open the live AgentSitter dashboard in your default browser.
+    """
+    import webbrowser
+    webbrowser.open(DEFAULT_DASHBOARD_URL)
+    term.secho(f"Opened dashboard at {DEFAULT_DASHBOARD_URL}", fg=term.colors.GREEN)
+
+
+# checks whose results status_checks caches
+STATUS_CHECKS = ("tunnel", "cert", "network")
+
+
+def status_checks() -> dict:
+    """
+    Run the status checks, reusing the results cached in STATUS_CACHE_PATH
+    if they are less than STATUS_CACHE_TTL seconds old.
+    """
+    import time
+    results = None
+    try:
+        if time.time() - STATUS_CACHE_PATH.stat().st_mtime < STATUS_CACHE_TTL:
+            results = json.loads(STATUS_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        pass
+    if isinstance(results, dict) and all(isinstance(results.get(k), bool) for k in STATUS_CHECKS):
+        # the token check is just a file read, so it's never cached
+        results["token"] = token_present()
+        return results
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    def check(fn) -> bool:
+        try:
+            return fn()
+        except Exception:
+            return False
+
+    checks = {
+        # 1. Is the tunnel accepting connections?
+        "tunnel": proxy_listening,
+        # 2. Is our CA cert installed?
+        "cert": cert_installed,
+        # 3. Is the Docker network present?
+        "network": network_exists,
+    }
+    # the checks are independent (mostly waiting on certutil/docker), so run them together
+    with ThreadPoolExecutor(max_workers=min(len(checks), os.cpu_count() or 1)) as pool:
+        futures = {name: pool.submit(check, fn) for name, fn in checks.items()}
+    results = {name: future.result() for name, future in futures.items()}
+    try:
+        STATUS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        STATUS_CACHE_PATH.write_text(json.dumps(results))
+    except OSError:
+        pass
+    # 4. API token configured in bashrc?
+    results["token"] = token_present()
+    return results
+
+
+def status():
+    """
+    Show sittr health:
+      • tunnel up?
+      • cert trusted?
+      • docker network exists?
+    """
+    results = status_checks()
+    term.secho(f"Tunel started: {'✅' if results['tunnel'] else '❌'}")
+    term.secho(f"CA certificate trusted: {'✅' if results['cert'] else '❌'}")
+    term.secho(f"Docker network '{NETWORK_NAME}' exists: {'✅' if results['network'] else '❌'}")
+    term.secho(f"API token configured in bashrc: {'✅' if results['token'] else '❌'}")
+
+
+def batch(cmds: list[str], stop_on_error: bool = True):
+    """
+    Run several sittr commands in one process, e.g.
+    sittr batch cert-install "docker-network-setup --proxy-port 8080" tunnel-start
+    """
+    import shlex
+    from sittr.__main__ import run_command
+    from sittr.cmds import COMMANDS
+
+    # resolve everything up front so a typo doesn't run half the batch
+    plan = []
+    for entry in cmds:
+        argv = shlex.split(entry) or [""]
+        if argv[0] not in COMMANDS or argv[0] == "batch":
+            term.secho(f"Unknown command '{argv[0]}'", fg=term.colors.RED)
+            raise term.Exit(2)
+        plan.append((entry, argv))
+
+    failed = []
+    for entry, argv in plan:
+        term.secho(f"==> {entry}", fg=term.colors.BLUE)
+        try:
+            run_command(argv)
+            ok = True
+        except (term.Exit, SystemExit) as e:
+            ok = not (e.exit_code if isinstance(e, term.Exit) else e.code)
+        except Exception as e:
+            term.secho(f"{entry} failed: {e}", fg=term.colors.RED)
+            ok = False
+        if not ok:
+            failed.append(entry)
+            if stop_on_error:
+                break
+
+    if failed:
+        term.secho(f"Failed: {', '.join(failed)}", fg=term.colors.RED)
+        raise term.Exit(1)
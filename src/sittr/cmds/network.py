@@ -0,0 +1,221 @@
+"""
+Docker network commands: create/remove 'agent-sitter-net' and the
+DOCKER-USER iptables rules that force containers through the proxy.
+"""
+import os
+import socket
+import json
+import subprocess
+
+from sittr import term
+from sittr.common import (
+    DEFAULT_PROXY_HOST,
+    DEFAULT_PROXY_PORT,
+    NETWORK_NAME,
+    DOCKER_SOCKET,
+    IS_DARWIN,
+    invalidate_status_cache,
+)
+
+
+def network_exists() -> bool:
+    """Return True if the Docker network is present."""
+    res = subprocess.run(
+        ["docker", "network", "inspect", NETWORK_NAME],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    return res.returncode == 0
+
+
+def resolve_proxy_ip(host: str) -> str:
+    try:
+        return socket.gethostbyname(host)
+    except socket.gaierror:
+        term.secho(f"ERROR: Unable to resolve proxy host '{host}'", fg=term.colors.RED)
+        raise term.Exit(1)
+
+
+def docker_default_daemon() -> bool:
+    """
+    Return True if the docker CLI talks to the default local daemon, i.e.
+    no DOCKER_HOST and no non-default context (env or ~/.docker/config.json).
+    """
+    if os.environ.get("DOCKER_HOST"):
+        return False
+    context = os.environ.get("DOCKER_CONTEXT")
+    if context is None:
+        config_dir = os.environ.get("DOCKER_CONFIG") or os.path.expanduser("~/.docker")
+        try:
+            with open(os.path.join(config_dir, "config.json")) as f:
+                context = json.load(f).get("currentContext")
+        except (OSError, ValueError, AttributeError):
+            context = None
+    return context in (None, "", "default")
+
+
+def docker_api_get(path: str) -> tuple[int, bytes] | None:
+    """
+    GET a Docker Engine API path over the daemon's UNIX socket.
+    Returns (status, body), or None if the socket isn't usable or the
+    docker CLI is configured for a different daemon.
+    """
+    import http.client
+    if not docker_default_daemon():
+        return None
+    conn = http.client.HTTPConnection("localhost", timeout=5)
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(5)
+        conn.sock = sock
+        sock.connect(DOCKER_SOCKET)
+        conn.request("GET", path)
+        resp = conn.getresponse()
+        return resp.status, resp.read()
+    except (OSError, http.client.HTTPException):
+        return None
+    finally:
+        conn.close()
+
+
+def inspect_network() -> dict:
+    # Talk to the daemon directly; for anything but a hit (including 404),
+    # fall back to the docker CLI
+    res = docker_api_get(f"/networks/{NETWORK_NAME}")
+    if res is not None and res[0] == 200:
+        return json.loads(res[1])
+    out = subprocess.check_output([
+        "docker", "network", "inspect", NETWORK_NAME, "--format", "{{json .}}"
+    ]).decode()
+    return json.loads(out)
+
+
+def get_bridge_iface(cfg: dict) -> str:
+    # Try custom bridge name
+    name = cfg.get("Options", {}).get("com.docker.network.bridge.name", "")
+    if name and name != "<no value>":
+        return name
+    # Fallback to br-<first12 of ID>
+    netid = cfg.get("Id", "")
+    if netid:
+        return f"br-{netid[:12]}"
+    return ""
+
+
+def docker_user_rules(bridge: str, proxy_ip: str, proxy_port: int) -> list[list[str]]:
+    """Rule specs that confine the bridge to DNS and the proxy."""
+    return [
+        ["-i", bridge, "-p", "udp", "--dport", "53", "-j", "ACCEPT"],
+        ["-i", bridge, "-p", "tcp", "--dport", "53", "-j", "ACCEPT"],
+        ["-i", bridge, "-p", "tcp", "-d", proxy_ip, "--dport", str(proxy_port), "-j", "ACCEPT"],
+        ["-i", bridge, "-j", "DROP"],
+    ]
+
+
+def iptables_restore(cmds: list[list[str]], check: bool = False) -> bool:
+    """
+    Apply filter-table commands (e.g. ["-I", "DOCKER-USER", "1", ...]) in a
+    single `iptables-restore --noflush` run, taking the xtables lock once.
+    Returns True on success.
+    """
+    import shlex
+    script = "*filter\n" + "".join(shlex.join(cmd) + "\n" for cmd in cmds) + "COMMIT\n"
+    res = subprocess.run(["sudo", "iptables-restore", "--noflush"], input=script.encode(), check=check)
+    return res.returncode == 0
+
+
+def docker_network_setup(
+    proxy_host: str = DEFAULT_PROXY_HOST,
+    proxy_port: int = DEFAULT_PROXY_PORT
+):
+    """
+    Create Docker network 'agent-sitter-net' and insert iptables rules
+    to force containers to use the proxy.
+    """
+    invalidate_status_cache()
+    # we don’t support Docker network proxying on macOS right now
+    if IS_DARWIN:
+        term.secho("Skipping Docker network & iptables setup on macOS", fg=term.colors.YELLOW)
+        return
+
+    proxy_ip = resolve_proxy_ip(proxy_host)
+
+    # 1. Create network if missing
+    exists = subprocess.run(
+        ["docker", "network", "inspect", NETWORK_NAME],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    ).returncode == 0
+    if not exists:
+        term.secho(f"Creating Docker network '{NETWORK_NAME}'...", fg=term.colors.GREEN)
+        subprocess.run(["docker", "network", "create", "--driver", "bridge", NETWORK_NAME], check=True)
+    else:
+        term.secho(f"Network '{NETWORK_NAME}' already exists; skipping creation.", fg=term.colors.YELLOW)
+
+    # 2. Inspect network for subnet and gateway
+    cfg = inspect_network()
+    ipam = cfg.get("IPAM", {}).get("Config", [{}])[0]
+    subnet = ipam.get("Subnet", "")
+    gateway = ipam.get("Gateway", "")
+    term.echo(f"Subnet: {subnet}")
+    term.echo(f"Gateway: {gateway}")
+
+    # 3. Determine bridge interface
+    bridge = get_bridge_iface(cfg)
+    if not bridge:
+        term.secho("ERROR: Could not determine bridge interface.", fg=term.colors.RED)
+        raise term.Exit(1)
+    term.echo(f"Bridge interface: {bridge}")
+
+    # 4. Insert iptables rules in DOCKER-USER
+    term.secho("Inserting iptables rules...", fg=term.colors.BLUE)
+    rules = docker_user_rules(bridge, proxy_ip, proxy_port)
+    iptables_restore([["-I", "DOCKER-USER", "1", *rule] for rule in rules], check=True)
+
+    # 5. Show current rules
+    term.echo()
+    subprocess.run(["sudo", "iptables", "-L", "DOCKER-USER", "-n", "--line-numbers"], check=False)
+
+
+def docker_network_cleanup(
+    proxy_host: str = DEFAULT_PROXY_HOST,
+    proxy_port: int = DEFAULT_PROXY_PORT
+):
+    """
+    Remove iptables rules and delete Docker network 'agent-sitter-net'.
+    """
+    invalidate_status_cache()
+    # no-op on macOS
+    if IS_DARWIN:
+        term.secho("Skipping Docker network & iptables cleanup on macOS", fg=term.colors.YELLOW)
+        return
+
+    proxy_ip = resolve_proxy_ip(proxy_host)
+
+    # 1. Try to get bridge iface (if network exists)
+    try:
+        cfg = inspect_network()
+        bridge = get_bridge_iface(cfg)
+        term.echo(f"Detected bridge interface: {bridge}")
+    except subprocess.CalledProcessError:
+        bridge = ""
+        term.secho("Network not found; skipping iptables cleanup.", fg=term.colors.YELLOW)
+
+    # 2. Remove iptables rules
+    if bridge:
+        term.secho("Removing iptables rules...", fg=term.colors.BLUE)
+        rules = docker_user_rules(bridge, proxy_ip, proxy_port)
+        deletes = [["-D", "DOCKER-USER", *rule] for rule in rules]
+        # the restore is all-or-nothing; if some rules are already gone,
+        # delete the rest one at a time
+        if not iptables_restore(deletes):
+            for cmd in deletes:
+                subprocess.run(["sudo", "iptables", *cmd], check=False)
+
+    # 3. Remove Docker network
+    removed = subprocess.run(
+        ["docker", "network", "rm", NETWORK_NAME],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    ).returncode == 0
+    if removed:
+        term.secho(f"Removed Docker network '{NETWORK_NAME}'", fg=term.colors.GREEN)
+    else:
+        term.secho(f"No Docker network '{NETWORK_NAME}' to remove", fg=term.colors.YELLOW)
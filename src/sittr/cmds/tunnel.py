@@ -0,0 +1,138 @@
+"""
+Tunnel commands: run the local stunnel to the AgentSitter proxy.
+"""
+import os
+import socket
+import subprocess
+from pathlib import Path
+
+from sittr import term
+from sittr.common import (
+    DEFAULT_PROXY_HOST,
+    DEFAULT_PROXY_PORT,
+    invalidate_status_cache,
+    which,
+)
+from sittr.cmds.network import get_bridge_iface, inspect_network
+
+# fixed stunnel config lines
+_ACCEPT_LOCAL = f"accept = {DEFAULT_PROXY_HOST}:{DEFAULT_PROXY_PORT}".encode()
+_CONNECT_UPSTREAM = b"connect = sitter.agentsitter.ai:3128"
+
+
+def tunnel_running() -> bool:
+    """Return True if stunnel is currently running."""
+    return subprocess.run(
+        ["pgrep", "-f", "stunnel"], stdout=subprocess.DEVNULL
+    ).returncode == 0
+
+
+def proxy_listening() -> bool:
+    """Return True if something accepts connections on the local proxy port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.05)
+        return sock.connect_ex(("127.0.0.1", DEFAULT_PROXY_PORT)) == 0
+
+
+def ensure_stunnel_installed():
+    """
+    Ensure 'stunnel' is installed, attempting apt-get or brew if missing.
+    """
+    if which("stunnel"):
+        return
+    term.secho("stunnel not found—installing...", fg=term.colors.YELLOW)
+    if which("apt-get"):
+        subprocess.run(["sudo", "apt-get", "update"], check=False)
+        subprocess.run(["sudo", "apt-get", "install", "-y", "stunnel4"], check=True)
+    elif which("brew"):
+        subprocess.run(["brew", "install", "stunnel"], check=True)
+    else:
+        term.secho("Could not auto-install stunnel; please install manually.", fg=term.colors.RED)
+        raise term.Exit(1)
+    which.cache_clear()
+    term.secho("stunnel installed successfully.", fg=term.colors.GREEN)
+
+
+def tunnel_start():
+    """
+    Start an stunnel to the AgentSitter proxy.
+    """
+    invalidate_status_cache()
+    ensure_stunnel_installed()
+    conf = [
+        b"foreground = no",
+        b"[proxy]",
+        b"client = yes",
+        _ACCEPT_LOCAL,
+    ]
+    try:
+        cfg = inspect_network()
+        bridge = get_bridge_iface(cfg)
+        gw = cfg.get("IPAM", {}).get("Config", [{}])[0].get("Gateway", "")
+        if gw:
+            conf.append(f"accept = {gw}:{DEFAULT_PROXY_PORT}".encode())
+            term.secho(f"Also binding on Docker bridge at {gw}:{DEFAULT_PROXY_PORT}", fg=term.colors.GREEN)
+    except Exception:
+        term.secho("No Docker bridge bind (network not found).", fg=term.colors.YELLOW)
+
+    conf.append(_CONNECT_UPSTREAM)
+    conf_bytes = b"\n".join(conf)
+    if hasattr(os, "memfd_create"):
+        # hand stunnel its config as an in-memory file rather than a stdin pipe
+        fd = os.memfd_create("stunnel-conf")
+        try:
+            os.write(fd, conf_bytes)
+            os.lseek(fd, 0, os.SEEK_SET)
+            subprocess.run(["stunnel", "-fd", str(fd)], pass_fds=(fd,), check=False)
+        finally:
+            os.close(fd)
+    else:
+        proc = subprocess.Popen(["stunnel", "-fd", "0"], stdin=subprocess.PIPE)
+        proc.communicate(input=conf_bytes)
+    term.secho("Stunnel started.", fg=term.colors.GREEN)
+
+
+def signal_stunnel() -> list[int] | None:
+    """
+    SIGTERM every stunnel process found by scanning /proc, like
+    `pkill stunnel`. Returns the pids we weren't allowed to signal, or
+    None if /proc isn't available (e.g. macOS) so the caller can fall
+    back to pkill.
+    """
+    import signal
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+
+    def is_stunnel(pid: int) -> bool:
+        try:
+            return (proc / str(pid) / "comm").read_text().startswith("stunnel")
+        except OSError:
+            return False
+
+    denied = []
+    for entry in proc.iterdir():
+        if not entry.name.isdigit() or not is_stunnel(int(entry.name)):
+            continue
+        try:
+            os.kill(int(entry.name), signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+        except PermissionError:
+            denied.append(int(entry.name))
+    return denied
+
+
+def tunnel_stop():
+    """
+    Stop any running stunnel process.
+    """
+    invalidate_status_cache()
+    denied = signal_stunnel()
+    if denied is None:
+        subprocess.run(["pkill", "stunnel"], check=False)
+    elif denied:
+        pids = ", ".join(map(str, denied))
+        term.secho(f"Permission denied stopping stunnel (pid {pids}); try with sudo.", fg=term.colors.RED)
+        raise term.Exit(1)
+    term.secho("Stopped stunnel.", fg=term.colors.GREEN)
@@ -0,0 +1,63 @@
+"""
+Settings and process helpers shared by the sittr commands.
+"""
+import os
+import sys
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+
+DEFAULT_PROXY_HOST = "localhost"
+DEFAULT_PROXY_PORT = 8080
+DEFAULT_DASHBOARD_URL = "https://www.agentsitter.ai"
+DEFAULT_TOKEN_URL = "https://www.agentsitter.ai/token/new"
+CERT_URL = "https://agentsitter.ai/certs/ca-cert.pem"
+CERT_PATH = Path.cwd() / "ca-cert.pem"
+CERT_ETAG_PATH = Path.cwd() / "ca-cert.pem.etag"
+NETWORK_NAME = "agent-sitter-net"
+DOCKER_SOCKET = "/var/run/docker.sock"
+STATUS_CACHE_PATH = Path.home() / ".cache" / "sittr" / "status.json"
+STATUS_CACHE_TTL = 2.0
+# pre-rendered `sittr --help`, see scripts/gen_help.py
+HELP_PATH = Path(__file__).with_name("_help.txt")
+IS_LINUX = sys.platform.startswith("linux")
+IS_DARWIN = sys.platform == "darwin"
+# pick the right RC file for token persistence
+if IS_DARWIN:
+    RC_PATH = Path.home() / ".zshrc"
+else:
+    RC_PATH = Path.home() / ".bashrc"
+
+
+@lru_cache(maxsize=None)
+def which(name: str) -> str | None:
+    """Cached shutil.which; PATH lookups don't change during a run."""
+    import shutil
+    return shutil.which(name)
+
+
+def invalidate_status_cache():
+    """Drop cached `sittr status` results after a command changes state."""
+    STATUS_CACHE_PATH.unlink(missing_ok=True)
+
+
+def spawn(argv: list[str], check: bool = False) -> int:
+    """
+    Run argv with os.posix_spawnp and wait for it, avoiding subprocess's
+    fork+exec for commands whose output we don't capture.
+    """
+    import signal
+    # like subprocess, give the child default handlers for the signals
+    # Python ignores
+    pid = os.posix_spawnp(argv[0], argv, os.environ, setsigdef=(signal.SIGPIPE, signal.SIGXFSZ))
+    try:
+        _, status = os.waitpid(pid, 0)
+    except BaseException:
+        # e.g. Ctrl-C: don't leave the child running or unreaped
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        raise
+    returncode = os.waitstatus_to_exitcode(status)
+    if check and returncode:
+        raise subprocess.CalledProcessError(returncode, argv)
+    return returncode
@@ -0,0 +1,60 @@
+"""
+Minimal terminal helpers for the sittr commands.
+
+These cover the handful of typer/click calls the commands make (echo,
+secho, prompt, confirm, Exit) so running a command doesn't have to
+import typer.
+"""
+import sys
+
+
+class colors:
+    RED = "red"
+    GREEN = "green"
+    YELLOW = "yellow"
+    BLUE = "blue"
+
+
+_ANSI = {colors.RED: 31, colors.GREEN: 32, colors.YELLOW: 33, colors.BLUE: 34}
+
+
+class Exit(Exception):
+    """Stop the current command with the given exit code."""
+
+    def __init__(self, code: int = 0):
+        super().__init__(code)
+        self.exit_code = code
+
+
+def echo(message: str = "", nl: bool = True):
+    sys.stdout.write(message + ("\n" if nl else ""))
+    sys.stdout.flush()
+
+
+def secho(message: str = "", fg: str | None = None, nl: bool = True):
+    """echo, coloured with fg when stdout is a terminal."""
+    if fg and sys.stdout.isatty():
+        message = f"\033[{_ANSI[fg]}m{message}\033[0m"
+    echo(message, nl=nl)
+
+
+def prompt(text: str, default: str | None = None) -> str:
+    """Ask for a value, returning default on empty input if one is given."""
+    suffix = f" [{default}]: " if default is not None else ": "
+    while True:
+        value = input(text + suffix)
+        if value:
+            return value
+        if default is not None:
+            return default
+
+
+def confirm(text: str) -> bool:
+    """Ask a yes/no question, defaulting to no."""
+    while True:
+        value = input(f"{text} [y/N]: ").strip().lower()
+        if value in ("y", "yes"):
+            return True
+        if value in ("", "n", "no"):
+            return False
+        echo("Error: invalid input")
@@ -0,0 +1,38 @@
+"""
+The sittr commands as a typer app, used for `sittr typer-app ...`, shell
+completion, and scripts that import `sittr.app`.
+"""
+import functools
+
+import typer
+
+from sittr import term
+from sittr.common import HELP_PATH
+from sittr.cmds import COMMANDS, load_command
+
+app = typer.Typer(help="AgentSitter.ai CLI (sittr)")
+
+
+@app.callback(invoke_without_command=True)
+def main(ctx: typer.Context):
+    if ctx.invoked_subcommand is None:
+        if HELP_PATH.exists():
+            typer.echo(HELP_PATH.read_text(), nl=False)
+        else:
+            typer.echo(ctx.get_help())
+        raise typer.Exit()
+
+
+def command(fn):
+    """Register a sittr command, mapping term.Exit onto typer.Exit."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except term.Exit as e:
+            raise typer.Exit(e.exit_code)
+    app.command()(wrapper)
+
+
+for name in COMMANDS:
+    command(load_command(name))
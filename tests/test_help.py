@@ -0,0 +1,11 @@
+from typer.testing import CliRunner
+
+from sittr.common import HELP_PATH
+from sittr.typer_app import app
+
+
+def test_help_text_is_current():
+    # rendered exactly as scripts/gen_help.py does; rerun it if this fails
+    result = CliRunner().invoke(app, ["--help"], prog_name="sittr", env={"COLUMNS": "80"})
+    assert result.exit_code == 0
+    assert result.output == HELP_PATH.read_text()
@@ -0,0 +1,24 @@
+from sittr.__main__ import build_parser
+
+
+def example(cmds: list[str], stop_on_error: bool = True, proxy_port: int = 8080, proxy_host: str = "localhost"):
+    """Example command."""
+
+
+def test_build_parser_defaults():
+    args = build_parser("example", example).parse_args(["a", "b c"])
+    assert vars(args) == {
+        "cmds": ["a", "b c"],
+        "stop_on_error": True,
+        "proxy_port": 8080,
+        "proxy_host": "localhost",
+    }
+
+
+def test_build_parser_options():
+    args = build_parser("example", example).parse_args(
+        ["a", "--no-stop-on-error", "--proxy-port", "9090", "--proxy-host", "example.com"]
+    )
+    assert args.stop_on_error is False
+    assert args.proxy_port == 9090
+    assert args.proxy_host == "example.com"